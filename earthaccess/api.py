@@ -1,8 +1,10 @@
+from __future__ import annotations
+
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import requests
-import s3fs
 from fsspec import AbstractFileSystem
 from typing_extensions import Any, Dict, List, Mapping, Optional, Union, deprecated
 
@@ -16,6 +18,9 @@ from .store import Store
 from .system import PROD, System
 from .utils import _validation as validate
 
+if TYPE_CHECKING:
+    import s3fs
+
 logger = logging.getLogger(__name__)
 
 
@@ -1,9 +1,9 @@
 # DAACS ~= NASA Earthdata data centers
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 
-DAACS = [
+DAACS: List[Dict[str, Any]] = [
     {
         "short-name": "NSIDC",
         "name": "National Snow and Ice Data Center",
@@ -105,6 +105,11 @@ DAACS = [
     },
 ]
 
+# DAACS indexed by short name, so provider lookups don't scan the whole list.
+# The index is built once at import, so DAACS is treated as immutable.
+_DAACS_BY_SHORT_NAME: Dict[Optional[str], Dict[str, Any]] = {
+    daac["short-name"]: daac for daac in DAACS
+}
 
 # Some testing urls behind EDL
 DAAC_TEST_URLS = [
@@ -121,18 +126,18 @@ DAAC_TEST_URLS = [
 def find_provider(
     daac_short_name: Optional[str] = None, cloud_hosted: Optional[bool] = None
 ) -> Union[str, None]:
-    for daac in DAACS:
-        if daac_short_name == daac["short-name"]:
-            if cloud_hosted:
-                if len(daac["cloud-providers"]) > 0:
-                    return daac["cloud-providers"][0]
-                else:
-                    # We found the DAAC, but it does not have cloud data
-                    return daac["on-prem-providers"][0]
-            else:
-                # return on prem provider code
-                return daac["on-prem-providers"][0]
-    return None
+    daac = _DAACS_BY_SHORT_NAME.get(daac_short_name)
+    if daac is None:
+        return None
+    if cloud_hosted:
+        if len(daac["cloud-providers"]) > 0:
+            return daac["cloud-providers"][0]
+        else:
+            # We found the DAAC, but it does not have cloud data
+            return daac["on-prem-providers"][0]
+    else:
+        # return on prem provider code
+        return daac["on-prem-providers"][0]
 
 
 def find_provider_by_shortname(short_name: str, cloud_hosted: bool) -> Union[str, None]:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List
 from uuid import uuid4
 
@@ -14,14 +15,22 @@ def _load_static_files() -> List[str]:
     ]
 
 
+@lru_cache
+def _inline_styles() -> str:
+    """Wrap the static styles in `<style>` tags.
+
+    The result is cached, since it is embedded in every granule repr.
+    """
+    return "".join(f"<style>{style}</style>" for style in _load_static_files())
+
+
 def _repr_collection_html() -> str:
     return "<div></div>"
 
 
 def _repr_granule_html(granule: Any) -> str:
-    css_styles = _load_static_files()
     css_inline = f"""<div id="{uuid4()}" style="height: 0px; display: none">
-            {''.join([f"<style>{style}</style>" for style in css_styles])}
+            {_inline_styles()}
             </div>"""
     style = "max-height: 120px;"
     dataviz_img = "".join(
@@ -33,7 +42,7 @@ def _repr_granule_html(granule: Any) -> str:
     )
     data_links = "".join(
         [
-            f'<a href="{link}" target="_blank" class="btn btn-secondary btn-sm">{link.split("/")[-1]}</a>'
+            f'<a href="{link}" target="_blank" class="btn btn-secondary btn-sm">{link.rsplit("/", 1)[-1]}</a>'
             for link in granule.data_links()
         ]
     )
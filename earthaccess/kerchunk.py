@@ -4,7 +4,6 @@ from typing import Optional, Union
 
 import fsspec
 import fsspec.utils
-import s3fs
 
 import earthaccess
 
@@ -13,6 +12,7 @@ def _get_chunk_metadata(
     granule: earthaccess.DataGranule,
     fs: fsspec.AbstractFileSystem,
 ) -> list[dict]:
+    import s3fs
     from kerchunk.hdf import SingleHdf5ToZarr
 
     metadata = []
@@ -31,20 +31,16 @@ class CustomDict(dict):
             self.render_dict = self._filter_fields_(fields)
 
     def _filter_fields_(self, fields: List[str]) -> Dict[str, Any]:
-        filtered_dict = {
-            "umm": dict(
-                (field, self["umm"][field]) for field in fields if field in self["umm"]
-            )
-        }
-        basic_dict = {
-            "meta": dict(
-                (field, self["meta"][field])
+        umm = self["umm"]
+        meta = self["meta"]
+        return {
+            "meta": {
+                field: meta[field]
                 for field in self._basic_meta_fields_
-                if field in self["meta"]
-            )
+                if field in meta
+            },
+            "umm": {field: umm[field] for field in fields if field in umm},
         }
-        basic_dict.update(filtered_dict)
-        return basic_dict
 
     def _filter_related_links(self, filter: str) -> List[str]:
         """Filter RelatedUrls from the UMM fields on CMR."""
@@ -219,18 +215,9 @@ class DataGranule(CustomDict):
         fields: Optional[List[str]] = None,
         cloud_hosted: bool = False,
     ):
-        super().__init__(collection)
-        self.cloud_hosted = cloud_hosted
+        super().__init__(collection, fields, cloud_hosted)
         # TODO: maybe add area, start date and all that as an instance value
         self["size"] = self.size()
-        self.uuid = str(uuid.uuid4())
-        self.render_dict: Any
-        if fields is None:
-            self.render_dict = self
-        elif fields[0] == "basic":
-            self.render_dict = self._filter_fields_(self._basic_umm_fields_)
-        else:
-            self.render_dict = self._filter_fields_(fields)
 
     def __repr__(self) -> str:
         """Placeholder.
@@ -238,7 +225,7 @@ class DataGranule(CustomDict):
         Returns:
             A basic representation of a data granule.
         """
-        data_links = [link for link in self.data_links()]
+        data_links = self.data_links()
         rep_str = f"""
         Collection: {self['umm']['CollectionReference']}
         Spatial coverage: {self['umm']['SpatialExtent']}
@@ -266,31 +253,26 @@ class DataGranule(CustomDict):
     def size(self) -> float:
         """Placeholder.
 
+        The size is also stored as `granule["size"]` when the granule is built, and
+        `Store` reads that stored value when it logs the total size of a request.
+
         Returns:
             The total size for the granule in MB.
         """
         try:
             data_granule = self["umm"]["DataGranule"]
-            total_size = sum(
-                [
-                    float(s["Size"])
-                    for s in data_granule["ArchiveAndDistributionInformation"]
-                    if "ArchiveAndDistributionInformation" in data_granule
-                ]
-            )
-        except Exception:
-            try:
-                data_granule = self["umm"]["DataGranule"]
-                total_size = sum(
-                    [
-                        float(s["SizeInBytes"])
-                        for s in data_granule["ArchiveAndDistributionInformation"]
-                        if "ArchiveAndDistributionInformation" in data_granule
-                    ]
-                ) / (1024 * 1024)
-            except Exception:
-                total_size = 0
-        return total_size
+            files = data_granule["ArchiveAndDistributionInformation"] or []
+        except (KeyError, TypeError):
+            # missing, null or non-dict UMM entries
+            return 0
+        try:
+            return sum(float(f["Size"]) for f in files)
+        except (KeyError, TypeError, ValueError):
+            pass
+        try:
+            return sum(float(f["SizeInBytes"]) for f in files) / (1024 * 1024)
+        except (KeyError, TypeError, ValueError):
+            return 0
 
     def _derive_s3_link(self, links: List[str]) -> List[str]:
         s3_links = []
@@ -319,8 +301,14 @@ class DataGranule(CustomDict):
         Returns:
             The data links for the requested access type.
         """
-        https_links = self._filter_related_links("GET DATA")
-        s3_links = self._filter_related_links("GET DATA VIA DIRECT ACCESS")
+        https_links: List[str] = []
+        s3_links: List[str] = []
+        # sort the links in a single pass over RelatedUrls
+        for link in self["umm"].get("RelatedUrls", []):
+            if link["Type"] == "GET DATA":
+                https_links.append(link["URL"])
+            elif link["Type"] == "GET DATA VIA DIRECT ACCESS":
+                s3_links.append(link["URL"])
         if in_region:
             # we are in us-west-2
             if self.cloud_hosted and access in (None, "direct"):
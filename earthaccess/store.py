@@ -1,17 +1,17 @@
+from __future__ import annotations
+
 import datetime
 import logging
 import shutil
 import traceback
 from functools import lru_cache
-from itertools import chain
 from pathlib import Path
 from pickle import dumps, loads
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union
 from uuid import uuid4
 
 import fsspec
 import requests
-import s3fs
 from multimethod import multimethod as singledispatchmethod
 from pqdm.threads import pqdm
 from typing_extensions import deprecated
@@ -23,8 +23,14 @@ from .daac import DAAC_TEST_URLS, find_provider
 from .results import DataGranule
 from .search import DataCollections
 
+if TYPE_CHECKING:
+    import s3fs
+
 logger = logging.getLogger(__name__)
 
+# Status codes returned by DAACs when a session lacks the right auth cookies/tokens
+_AUTH_ERROR_STATUS_CODES = frozenset({400, 401, 403})
+
 
 class EarthAccessFile(fsspec.spec.AbstractBufferedFile):
     """Handle for a file-like object pointing to an on-prem or Earthdata Cloud granule."""
@@ -82,6 +88,9 @@ def _open_files(
 def make_instance(
     cls: Any, granule: DataGranule, auth: Auth, data: Any
 ) -> EarthAccessFile:
+    # s3fs pulls in aiobotocore, so defer importing it until it is needed
+    import s3fs
+
     # Attempt to re-authenticate
     if not earthaccess.__auth__.authenticated:
         earthaccess.__auth__ = auth
@@ -204,12 +213,12 @@ class Store(object):
 
         resp = self._http_session.request(method, url, allow_redirects=True)
 
-        if resp.status_code in [400, 401, 403]:
+        if resp.status_code in _AUTH_ERROR_STATUS_CODES:
             new_session = requests.Session()
             resp_req = new_session.request(
                 method, url, allow_redirects=True, cookies=self._requests_cookies
             )
-            if resp_req.status_code in [400, 401, 403]:
+            if resp_req.status_code in _AUTH_ERROR_STATUS_CODES:
                 resp.raise_for_status()
             else:
                 self._requests_cookies.update(new_session.cookies.get_dict())
@@ -255,6 +264,8 @@ class Store(object):
         Returns:
             a s3fs file instance
         """
+        import s3fs
+
         if self.auth is None:
             raise ValueError(
                 "A valid Earthdata login instance is required to retrieve S3 credentials"
@@ -382,7 +393,7 @@ class Store(object):
         pqdm_kwargs: Optional[Mapping[str, Any]] = None,
     ) -> List[Any]:
         fileset: List = []
-        total_size = round(sum([granule.size() for granule in granules]) / 1024, 2)
+        total_size = round(sum(granule["size"] for granule in granules) / 1024, 2)
         logger.info(f"Opening {len(granules)} granules, approx size: {total_size} GB")
 
         if self.auth is None:
@@ -615,14 +626,14 @@ class Store(object):
         endpoint = self._own_s3_credentials(granules[0]["umm"]["RelatedUrls"])
         cloud_hosted = granules[0].cloud_hosted
         access = "direct" if (cloud_hosted and self.in_region) else "external"
-        data_links = list(
-            # we are not in-region
-            chain.from_iterable(
+        total_size = 0.0
+        # collect the links and the download size in a single pass over the granules
+        for granule in granules:
+            data_links.extend(
                 granule.data_links(access=access, in_region=self.in_region)
-                for granule in granules
             )
-        )
-        total_size = round(sum(granule.size() for granule in granules) / 1024, 2)
+            total_size += granule["size"]
+        total_size = round(total_size / 1024, 2)
         logger.info(
             f" Getting {len(granules)} granules, approx download size: {total_size} GB"
         )
@@ -665,7 +676,7 @@ class Store(object):
         # If the get data link is an Opendap location
         if "opendap" in url and url.endswith(".html"):
             url = url.replace(".html", "")
-        local_filename = url.split("/")[-1]
+        local_filename = url.rsplit("/", 1)[-1]
         path = directory / Path(local_filename)
         if not path.exists():
             try:
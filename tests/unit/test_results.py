@@ -4,6 +4,7 @@ import logging
 import os.path
 
 import earthaccess
+from earthaccess.results import DataGranule
 from earthaccess.search import DataCollections
 from vcr.unittest import VCRTestCase  # type: ignore[import-untyped]
 
@@ -224,3 +225,67 @@ class TestResults(VCRTestCase):
             # Verify that Search After was used in all requests except first
             self.assertEqual(first_request, "CMR-Search-After" not in request.headers)
             first_request = False
+
+
+def test_granule_render_dict_fields():
+    granule = DataGranule(
+        {
+            "meta": {
+                "concept-id": "G123-PROV",
+                "provider-id": "PROV",
+                "revision-id": 1,
+            },
+            "umm": {"GranuleUR": "granule.h5", "RelatedUrls": [], "Other": "x"},
+        },
+        fields=["GranuleUR", "Missing"],
+    )
+
+    assert granule.render_dict == {
+        "meta": {"concept-id": "G123-PROV", "provider-id": "PROV"},
+        "umm": {"GranuleUR": "granule.h5"},
+    }
+
+
+def test_granule_data_links():
+    granule = DataGranule(
+        {
+            "umm": {
+                "RelatedUrls": [
+                    {"URL": "https://example.com/a.h5", "Type": "GET DATA"},
+                    {"URL": "s3://bucket/a.h5", "Type": "GET DATA VIA DIRECT ACCESS"},
+                    {
+                        "URL": "https://example.com/a.jpg",
+                        "Type": "GET RELATED VISUALIZATION",
+                    },
+                    {"URL": "https://example.com/b.h5", "Type": "GET DATA"},
+                ]
+            }
+        },
+        cloud_hosted=True,
+    )
+
+    assert granule.data_links() == [
+        "https://example.com/a.h5",
+        "https://example.com/b.h5",
+    ]
+    assert granule.data_links(access="direct") == ["s3://bucket/a.h5"]
+    assert granule.data_links(in_region=True) == ["s3://bucket/a.h5"]
+    assert DataGranule({"umm": {}}).data_links() == []
+
+
+def test_granule_size():
+    def granule(files):
+        return DataGranule(
+            {"umm": {"DataGranule": {"ArchiveAndDistributionInformation": files}}}
+        )
+
+    assert granule([{"Size": 1.5}, {"Size": "2.5"}]).size() == 4.0
+    assert granule([{"SizeInBytes": 1024 * 1024}, {"SizeInBytes": 0}]).size() == 1.0
+    assert granule([{"Size": 1.5}, {"SizeInBytes": 1024}]).size() == 0
+    assert DataGranule({"umm": {}}).size() == 0
+    assert DataGranule({"umm": {"DataGranule": None}}).size() == 0
+    assert DataGranule({"umm": None}).size() == 0
+    assert DataGranule({"umm": "x"}).size() == 0
+    assert DataGranule({"umm": {"DataGranule": "x"}}).size() == 0
+    assert granule(None).size() == 0
+    assert granule(["x"]).size() == 0
@@ -1,12 +1,13 @@
 # package imports
 import os
 import unittest
+from unittest import mock
 
 import fsspec
 import pytest
 import responses
 import s3fs
-from earthaccess import Auth, Store
+from earthaccess import Auth, DataGranule, Store
 from earthaccess.store import EarthAccessFile
 
 
@@ -128,6 +129,37 @@ class TestStoreSessions(unittest.TestCase):
 
         return None
 
+    @responses.activate
+    def test_store_get_logs_stored_granule_size(self):
+        responses.add(
+            responses.GET,
+            "https://urs.earthdata.nasa.gov/profile",
+            json={},
+            status=200,
+        )
+        store = Store(self.auth)
+        granule = DataGranule(
+            {
+                "meta": {"concept-id": "G123-PROV", "provider-id": "PROV"},
+                "umm": {
+                    "RelatedUrls": [
+                        {"URL": "https://example.com/a.h5", "Type": "GET DATA"}
+                    ],
+                    "DataGranule": {
+                        "ArchiveAndDistributionInformation": [{"Size": 2048}]
+                    },
+                },
+            }
+        )
+        # the total size comes from granule["size"], not a fresh size() call
+        granule["umm"]["DataGranule"]["ArchiveAndDistributionInformation"] = []
+
+        with mock.patch.object(store, "_download_onprem_granules", return_value=[]):
+            with self.assertLogs("earthaccess.store", level="INFO") as logs:
+                store.get([granule], local_path="data")
+
+        self.assertIn("approx download size: 2.0 GB", "\n".join(logs.output))
+
 
 @pytest.mark.xfail(
     reason="Expected failure: Reproduces a bug (#610) that has not yet been fixed."